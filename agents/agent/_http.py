@@ -0,0 +1,49 @@
+import asyncio
+from typing import AsyncIterator, Optional
+
+import aiohttp
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+_session_guard: Optional[AsyncIterator[None]] = None
+
+async def _close_on_loop_shutdown(session: aiohttp.ClientSession) -> AsyncIterator[None]:
+    # asyncio.run() 关闭事件循环前会调用 loop.shutdown_asyncgens()，
+    # 借此在循环仍然可用时关闭在该循环上创建的 session
+    try:
+        yield
+    finally:
+        await session.close()
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    返回模块级共享的 aiohttp.ClientSession，首次调用时在当前事件循环上惰性创建。
+    所有工具复用同一个连接池，避免每次调用重新进行 TCP + TLS 握手。
+    切换到新的事件循环时，旧 session 会先在其所属的循环上关闭。
+    """
+    global _session, _session_loop, _session_guard
+    loop = asyncio.get_running_loop()
+    if _session is not None and _session_loop is not loop:
+        if not _session.closed and _session_loop.is_running():
+            # 旧循环仍在其他线程运行，交给它自己关闭连接
+            asyncio.run_coroutine_threadsafe(_session.close(), _session_loop)
+        _session = None
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+        )
+        _session_loop = loop
+        _session_guard = _close_on_loop_shutdown(_session)
+        await _session_guard.__anext__()
+    return _session
+
+async def close_session() -> None:
+    """关闭共享的 ClientSession（如果已创建），应在服务关闭时于事件循环内调用。"""
+    global _session, _session_loop, _session_guard
+    if _session is not None and not _session.closed:
+        await _session.close()
+    if _session_guard is not None:
+        await _session_guard.aclose()
+    _session = None
+    _session_loop = None
+    _session_guard = None
@@ -0,0 +1,81 @@
+import contextlib
+import functools
+import hashlib
+import hmac
+import os
+import time
+from typing import Any, AsyncIterator, Dict
+
+import aiohttp
+import orjson
+from dotenv import load_dotenv
+
+from ._http import get_session
+
+load_dotenv()
+
+ak = os.getenv("ak")
+sk = os.getenv("sk")
+sk_bytes = sk.encode('utf-8') if sk else None
+
+host = 'https://01bot.baidu.com'
+router = '/api/01bot/sse-gateway/stream'
+reqUrl = host + router
+# router 固定不变，canonicalRequest 只有 content-md5 部分随请求变化
+canonicalPrefix = f"POST\n{router}\ncontent-md5:".encode('utf-8')
+
+def getmd5(data):
+    return hashlib.md5(data).hexdigest()
+
+def hmacsha256(secret: bytes, message: bytes) -> str:
+    # hmac.digest 走 OpenSSL 的一次性计算路径，比 hmac.new(...).hexdigest() 更快
+    return hmac.digest(secret, message, 'sha256').hex()
+
+_cached_sec = None
+_cached_ts = ""
+
+def _timestr():
+    # 签名时间为 GMT，按秒缓存格式化结果，同一秒内的并发调用共享同一个 authStringPrefix
+    global _cached_sec, _cached_ts
+    now_sec = int(time.time())
+    if _cached_sec != now_sec:
+        _cached_sec, _cached_ts = now_sec, time.strftime("%d %b %Y %H:%M:%S GMT", time.gmtime(now_sec))
+    return _cached_ts
+
+@functools.lru_cache(maxsize=4)
+def _signing_key(timestr):
+    # authStringPrefix 只随秒级时间戳变化，同一秒内的请求复用同一个 signingKey
+    # 返回 bytes，直接作为第二次 HMAC 的 secret
+    return hmacsha256(sk_bytes, f"ihcloud/{ak}/{timestr}/300".encode('utf-8')).encode('ascii')
+
+def _headers(body):
+    if not ak:
+        raise ValueError("Environment variable 'ak' is not set.")
+    timestr = _timestr()
+    authStringPrefix = f"ihcloud/{ak}/{timestr}/300"
+    signingKey = _signing_key(timestr)
+    canonicalRequest = canonicalPrefix + getmd5(body).encode('ascii')
+    signature = hmacsha256(signingKey, canonicalRequest)
+    return {
+        "Content-Type": "application/json",
+        "X-IHU-Authorization-V2": f"{authStringPrefix}/{signature}"
+    }
+
+@contextlib.asynccontextmanager
+async def _signed_request(message: Dict[str, Any]) -> AsyncIterator[aiohttp.ClientResponse]:
+    # 只序列化一次，md5 与请求体使用同一份 bytes
+    body = orjson.dumps(message)
+    headers = _headers(body)
+    session = await get_session()
+    async with session.post(reqUrl, data=body, headers=headers) as response:
+        yield response
+
+async def signed_post_text(message: Dict[str, Any]) -> str:
+    """对 message 签名并发送到 01bot SSE 网关（非流式），返回原始响应文本。"""
+    async with _signed_request(message) as response:
+        return await response.text()
+
+async def signed_post(message: Dict[str, Any]) -> Dict[str, Any]:
+    """对 message 签名并发送到 01bot SSE 网关（非流式），返回解析后的 JSON。"""
+    async with _signed_request(message) as response:
+        return orjson.loads(await response.read())
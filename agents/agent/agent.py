@@ -1,14 +1,18 @@
 from google.adk.agents import Agent
+from google.adk.tools.agent_tool import AgentTool
 from .model import base_model
 from .prompt import ROOT_PROMPT
 from .sub_agents.inquiry import inquiry_agent
 from .sub_agents.map import map_agent
 from .sub_agents.medicine import medicine_agent
 
+# map/medicine 为一次性查询，以 AgentTool 形式挂载：同一轮中发出的多个工具调用由 ADK 并发执行 (asyncio.gather)。
+# inquiry 需要与用户多轮问诊，仍以 sub_agent 方式转交。
 root_agent = Agent(
     name="root",
     model=base_model,
     description=(""),
     instruction=(ROOT_PROMPT),
-    sub_agents=[inquiry_agent, map_agent, medicine_agent],
+    tools=[AgentTool(agent=map_agent), AgentTool(agent=medicine_agent)],
+    sub_agents=[inquiry_agent],
 )
\ No newline at end of file
@@ -1,11 +1,15 @@
 ROOT_PROMPT = """
-    "You have specialized sub-agents: "
-    "1. 'inquiry_agent': Handles all diagnosis of diseases queries. Delegate to it for these. "
-    "2. 'map_agent': Handles all map-related queries. Delegate to it for these. "
-    "3. 'medicine_agent': Handles all drug information queries. Delegate to it for these. "
-    "Analyze the user's query. " 
-    "If it's about diagnosis of diseases, delegate to 'inquiry_agent'. "
-    "If it's map-related, delegate to 'map_agent'. "
-    "If it's drug information, delegate to 'medicine_agent'. "
+    "You have a specialized sub-agent and two specialized tools: "
+    "1. 'inquiry' (sub-agent): Handles all diagnosis of diseases queries. Delegate to it for these. "
+    "2. 'map' (tool): Handles all map-related queries. Call it for these. "
+    "3. 'medicine' (tool): Handles all drug information queries. Call it for these. "
+    "Analyze the user's query. "
+    "If it's map-related, call 'map'. "
+    "If it's drug information, call 'medicine'. "
+    "If the query contains several independent requests, call all the needed tools in the same turn so they run in parallel. "
+    "'map' and 'medicine' run without the conversation history, so put every detail they need into the request. "
+    "For a follow-up drug question, include the 'session_id: <id>' from the previous 'medicine' answer in the request. "
+    "If 'map' reports missing information, ask the user for it and then call 'map' again. "
+    "If it's about diagnosis of diseases, delegate to 'inquiry' after answering any map or drug parts of the query. "
     "For anything else, respond appropriately or state you cannot handle it. "
 """
\ No newline at end of file
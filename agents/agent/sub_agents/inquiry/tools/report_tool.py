@@ -1,19 +1,26 @@
 import html as _html
 from string import Template
+from typing import Union
 
-def render_html_std(template_str: str, **variables) -> str:
+def render_html_std(template: Union[str, Template], **variables) -> str:
     """
     使用标准库 string.Template 渲染，变量写法为 $var 或 ${var}。
+    template 可以是模板字符串，也可以是预先构造好的 Template（避免重复解析）。
     会对变量做 HTML 转义；不支持循环/条件。
     """
+    if not isinstance(template, Template):
+        template = Template(template)
     safe_vars = {k: _html.escape(str(v)) for k, v in variables.items()}
-    return Template(template_str).safe_substitute(safe_vars)
+    return template.safe_substitute(safe_vars)
 
 tpl = """
 <h1>$title</h1>
 <p>$intro</p>
 """
 
-html = render_html_std(tpl, title="报告页", intro="这是简介。")
+_REPORT_TPL = Template(tpl)
 
-print(html)
\ No newline at end of file
+if __name__ == "__main__":
+    html = render_html_std(_REPORT_TPL, title="报告页", intro="这是简介。")
+
+    print(html)
\ No newline at end of file
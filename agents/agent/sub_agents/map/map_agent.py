@@ -6,7 +6,7 @@ from .tools.amap_mcp import amap_mcp_tools
 map_agent = Agent(
     name="map",
     model=base_model,
-    description=(""),
+    description=("Answers questions about maps, locations and nearby places such as hospitals and pharmacies."),
     instruction=(MAP_PROMPT),
     tools=[amap_mcp_tools],
     sub_agents=[]
@@ -1,3 +1,6 @@
 MAP_PROMPT = """
-    "Your task is to answer questions about maps and locations."
+    "Your task is to answer questions about maps and locations. "
+    "You are called as a tool and cannot talk to the user directly. "
+    "If information you need is missing (for example the user's location), do not guess; "
+    "reply stating exactly which information is missing."
 """
\ No newline at end of file
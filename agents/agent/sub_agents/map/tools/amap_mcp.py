@@ -1,8 +1,32 @@
-from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
-from google.adk.tools.mcp_tool.mcp_session_manager import SseServerParams
-
-amap_mcp_tools = MCPToolset(
-    connection_params=SseServerParams(
-        url="https://mcp.amap.com/sse?key=2089a5b76f6b77a5a896a61203f040f9",  # 替换为你的 SSE server 地址
-    ),
-)
\ No newline at end of file
+from typing import Optional
+
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.tools.base_toolset import BaseToolset
+
+_inst = None
+
+def get_amap_tools():
+    """首次调用时才创建 MCPToolset，避免 import 时就准备 SSE 连接。"""
+    global _inst
+    if _inst is None:
+        from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
+        from google.adk.tools.mcp_tool.mcp_session_manager import SseServerParams
+
+        _inst = MCPToolset(
+            connection_params=SseServerParams(
+                url="https://mcp.amap.com/sse?key=2089a5b76f6b77a5a896a61203f040f9",  # 替换为你的 SSE server 地址
+            ),
+        )
+    return _inst
+
+class _LazyAmapToolset(BaseToolset):
+    """map_agent 使用的代理，只有在真正需要工具列表时才构造 MCPToolset。"""
+
+    async def get_tools(self, readonly_context: Optional[ReadonlyContext] = None):
+        return await get_amap_tools().get_tools(readonly_context)
+
+    async def close(self) -> None:
+        if _inst is not None:
+            await _inst.close()
+
+amap_mcp_tools = _LazyAmapToolset()
\ No newline at end of file
@@ -7,7 +7,7 @@ from .tools.ocr_tool import ocr_tool
 medicine_agent = Agent(
     name="medicine",
     model=base_model,
-    description=(""),
+    description=("Answers drug information questions and recognizes text on drug packaging images."),
     instruction=(MEDICINE_PROMPT),
     tools=[consult_drug_tool, ocr_tool],
     sub_agents=[]
@@ -1,4 +1,7 @@
 MEDICINE_PROMPT = """
     "Your task is to answer questions about drug information. "
+    "You are called as a tool and do not see earlier turns, so rely only on the request you receive. "
+    "If the request contains a DrugQA session_id, pass it to 'consult_drug' as session_id to keep the context. "
+    "Always end your answer with 'session_id: <id>' using the session_id returned by 'consult_drug'. "
     "For anything else, respond appropriately or state you cannot handle it. "
 """
\ No newline at end of file
@@ -1,28 +1,10 @@
 import json
-import hashlib
-import json
-import time
-import requests
-import hmac
+import aiohttp
 from typing import Optional, Dict, Any
 from google.adk.tools import FunctionTool
+from ...._ihu_client import signed_post_text
 
-from dotenv import load_dotenv
-import os
-
-load_dotenv()
-
-ak = os.getenv("ak")
-sk = os.getenv("sk")
-
-def getmd5(data):
-    return hashlib.md5(data.encode('utf-8')).hexdigest()
-
-def hmacsha256(secret, message):
-    data = message.encode('utf-8')
-    return hmac.new(secret.encode('utf-8'), data, digestmod=hashlib.sha256).hexdigest()
-
-def consult_drug(
+async def consult_drug(
     query: str,
     model: str = "third-common-v1-DrugQA",
     session_id: Optional[str] = None
@@ -40,9 +22,6 @@ def consult_drug(
     Returns:
         返回 API 的 JSON 字符串格式的应答。如果请求失败，则返回包含错误信息的字符串。
     """
-    host = 'https://01bot.baidu.com'
-    router = '/api/01bot/sse-gateway/stream'
-    reqUrl = host + router
 
     message: Dict[str, Any] = {
         "model": model,
@@ -62,31 +41,9 @@ def consult_drug(
     }
 
     try:
-        md5 = getmd5(json.dumps(message))
-        timestr = time.strftime("%d %b %Y %H:%M:%S GMT", time.localtime())
-        stream = False
-        if not ak:
-            raise ValueError("Environment variable 'ak' is not set.")
-        authStringPrefix = "ihcloud/" + ak + "/" + timestr + "/300"
-        signingKey = hmacsha256(sk, authStringPrefix)
-        host = 'https://01bot.baidu.com'
-        router = '/api/01bot/sse-gateway/stream'
-        reqUrl = host + router
-        canonicalRequest = '\n'.join(["POST", router, "content-md5:" + md5])
-        signature = hmacsha256(signingKey, canonicalRequest)
-        headers = {
-            "Content-Type": "application/json",
-            "X-IHU-Authorization-V2": authStringPrefix + "/" + signature
-        }
-        if stream:
-            response = requests.post(reqUrl, data=json.dumps(message), headers=headers, stream=True)
-            for line in response.iter_lines():
-                return line.decode('utf-8')
-        else:
-            response = requests.post(reqUrl, data=json.dumps(message), headers=headers)
-            return response.text
+        return await signed_post_text(message)
 
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         return json.dumps({"error": f"API request failed: {str(e)}"}, indent=2)
     except Exception as e:
         return json.dumps({"error": f"An unexpected error occurred: {str(e)}"}, indent=2)
@@ -1,6 +1,9 @@
-import requests
+import asyncio
+import time
+import orjson
 from typing import Dict, Any
 from google.adk.tools import FunctionTool
+from ...._http import get_session
 
 from dotenv import load_dotenv
 import os
@@ -10,16 +13,43 @@ load_dotenv()
 API_KEY = os.getenv("API_KEY")
 SECRET_KEY = os.getenv("SECRET_KEY")
 
-def get_access_token():
-    url = "https://aip.baidubce.com/oauth/2.0/token"
-    params = {
-        "grant_type": "client_credentials",
-        "client_id": API_KEY,
-        "client_secret": SECRET_KEY,
-    }
-    return str(requests.post(url, params=params).json().get("access_token"))
+# access_token 有效期约 30 天，进程内缓存，过期前 60 秒刷新
+_token_cache = {"token": None, "exp": 0}
+# 并发调用同时遇到缓存失效时，只允许一个协程去刷新
+_token_lock = asyncio.Lock()
 
-def recognize_text(
+def _cached_token():
+    if _token_cache["token"] and time.time() < _token_cache["exp"] - 60:
+        return _token_cache["token"]
+    return None
+
+async def get_access_token():
+    token = _cached_token()
+    if token:
+        return token
+
+    async with _token_lock:
+        # 等锁期间可能已有其他协程完成刷新
+        token = _cached_token()
+        if token:
+            return token
+
+        url = "https://aip.baidubce.com/oauth/2.0/token"
+        params = {
+            "grant_type": "client_credentials",
+            "client_id": API_KEY,
+            "client_secret": SECRET_KEY,
+        }
+        session = await get_session()
+        async with session.post(url, params=params) as response:
+            data = orjson.loads(await response.read())
+        token = data.get("access_token")
+        if token:
+            _token_cache["token"] = str(token)
+            _token_cache["exp"] = time.time() + data.get("expires_in", 2592000)
+        return str(token)
+
+async def recognize_text(
     url: str,
     detect_direction: bool = False,
     paragraph: bool = False,
@@ -39,7 +69,7 @@ def recognize_text(
     """
     try:
         # 1. 获取 access_token
-        url_access = "https://aip.baidubce.com/rest/2.0/ocr/v1/accurate_basic?access_token=" + get_access_token()
+        url_access = "https://aip.baidubce.com/rest/2.0/ocr/v1/accurate_basic?access_token=" + await get_access_token()
         
 
         # 2. 读取图片并转换为 Base64
@@ -59,8 +89,9 @@ def recognize_text(
             "Content-Type": "application/x-www-form-urlencoded",
             "Accept": "application/json",
         }
-        response = requests.post(url_access, headers=headers, data=payload)
-        result = response.json()
+        session = await get_session()
+        async with session.post(url_access, headers=headers, data=payload) as response:
+            result = orjson.loads(await response.read())
         result_num = result.get("words_result_num", 0)
 
         # 5. 解析结果
@@ -71,7 +102,8 @@ def recognize_text(
             }
 
         # 提取识别文本
-        text = "\n".join([item["words"] for item in result.get("words_result", [])])
+        words_result = result.get("words_result", [])
+        text = "\n".join(item["words"] for item in words_result)
 
         return {
             "text": text,
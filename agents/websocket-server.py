@@ -97,6 +97,12 @@ class Session:
 
 app = FastAPI(title="Agent WebSocket Server")
 
+@app.on_event("shutdown")
+async def close_http_session():
+    """在事件循环关闭前释放工具共享的 aiohttp 连接池"""
+    from agent._http import close_session
+    await close_session()
+
 # 获取服务器配置
 server_config = agentconfig.get_server_config()
 allowed_hosts = server_config.get("allowedHosts", ["localhost", "127.0.0.1", "0.0.0.0"])